@@ -5,11 +5,14 @@ dariah.topics.modeling
 This module implements low-level LDA modeling functions.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import csv
 import tempfile
 import os
 import logging
 import multiprocessing
+import platform
 import shutil
 from typing import Optional, Union
 
@@ -53,19 +56,35 @@ class LDA:
         self.random_state = random_state
         self.mallet = mallet
         if mallet:
+            self.mallet = str(self.mallet)
+            windows = platform.system() == "Windows"
             if not Path(self.mallet).exists():
                 # Check if MALLET is in environment variable:
-                if not os.environ.get(self.mallet):
-                    raise OSError(
-                        "MALLET executable was not found. "
-                        "'{}' does not exist".format(self.mallet)
-                    )
-                self.mallet = os.environ.get(self.mallet)
+                self.mallet = os.environ.get(self.mallet, self.mallet)
+            if not os.path.dirname(self.mallet):
+                # Subprocesses look up a bare name in PATH, not in the working
+                # directory. On Windows, this also finds `mallet.bat`:
+                self.mallet = shutil.which(self.mallet) or self.mallet
+            if windows and not Path(self.mallet).suffix:
+                # Windows cannot run the extensionless shell script:
+                batch = Path(self.mallet).with_suffix(".bat")
+                if batch.is_file():
+                    self.mallet = str(batch)
+            if not Path(self.mallet).exists():
+                raise OSError(
+                    "MALLET executable was not found. "
+                    "'{}' does not exist".format(self.mallet)
+                )
             if not Path(self.mallet).is_file():
                 raise OSError(
                     "'{}' is not a file. "
-                    "Point to the 'mallet/bin/mallet' file.".format(self.mallet)
+                    "Point to the '{}' file.".format(
+                        self.mallet,
+                        "mallet/bin/mallet.bat" if windows else "mallet/bin/mallet",
+                    )
                 )
+            # Keep the file that will actually be run, e.g. a local one:
+            self.mallet = str(Path(self.mallet).resolve())
         else:
             self._model = lda.LDA(
                 n_topics=self.num_topics,
@@ -236,40 +255,89 @@ class LDA:
             random_seed=self.random_state,
         )
 
+        # Parse the output files once, every property returns a copy:
+        self._read_mallet_outputs()
+
     @property
     def _mallet_topics(self):
         """Topics of MALLET LDA model.
         """
-        maximum = len(self._vocabulary)
-        num_words = 200 if maximum > 200 else maximum
-        index = [f"topic{n}" for n in range(self.num_topics)]
-        columns = [f"word{n}" for n in range(num_words)]
-        topics = utils.read_mallet_topics(self._topics_file, num_words)
-        return pd.DataFrame(topics, index=index, columns=columns)
+        return self._mallet_outputs["topics"].copy()
 
     @property
     def _mallet_topic_word(self):
         """Topic-word distributions of MALLET LDA model.
         """
-        index = [f"topic{n}" for n in range(self.num_topics)]
-        data = pd.read_csv(self._topic_word_file, sep="\t", header=None).dropna()
-        data = data.pivot(index=0, columns=1, values=2)
-        data.columns.name = None
-        data.index.name = None
-        data.index = index
-        return data
+        return self._mallet_outputs["topic_word"].copy()
 
     @property
     def _mallet_topic_document(self):
         """Topic-document distributions of MALLET LDA model.
         """
-        data = pd.read_csv(self._topic_document_file, sep="\t", header=None)
-        columns = [f"topic{n}" for n in range(self.num_topics)]
-        index = data[1]
-        data = data.drop([0, 1], axis=1)
-        data.columns = list(columns)
-        data.index = index
-        return data.T
+        return self._mallet_outputs["topic_document"].copy()
+
+    def _read_mallet_outputs(self) -> None:
+        """Parse all MALLET output files once.
+        """
+        readers = {
+            "topics": self._read_mallet_topics,
+            "topic_word": self._read_mallet_topic_word,
+            "topic_document": self._read_mallet_topic_document,
+        }
+        # Parse the files concurrently, pandas' C parser releases the GIL:
+        with ThreadPoolExecutor(max_workers=len(readers)) as executor:
+            futures = {name: executor.submit(read) for name, read in readers.items()}
+        self._mallet_outputs = {
+            name: future.result() for name, future in futures.items()
+        }
+
+    def _read_mallet_topics(self) -> pd.DataFrame:
+        """Read topics of MALLET LDA model.
+        """
+        maximum = len(self._vocabulary)
+        num_words = 200 if maximum > 200 else maximum
+        index = [f"topic{n}" for n in range(self.num_topics)]
+        columns = [f"word{n}" for n in range(num_words)]
+        topics = utils.read_mallet_topics(self._topics_file, num_words)
+        return pd.DataFrame(topics, index=index, columns=columns)
+
+    def _read_mallet_topic_word(self) -> pd.DataFrame:
+        """Read topic-word distributions of MALLET LDA model.
+        """
+        index = [f"topic{n}" for n in range(self.num_topics)]
+        # Keep words like `null` or `nan`, and words with quotes, as they are:
+        data = pd.read_csv(
+            self._topic_word_file,
+            sep="\t",
+            header=None,
+            dtype={1: str},
+            keep_default_na=False,
+            quoting=csv.QUOTE_NONE,
+            engine="c",
+        )
+        # Encode words as sorted column numbers in one vectorized pass:
+        columns, words = pd.factorize(data[1], sort=True)
+        weights = np.zeros((self.num_topics, len(words)))
+        weights[data[0].to_numpy(), columns] = data[2]
+        return pd.DataFrame(weights, index=index, columns=list(words))
+
+    def _read_mallet_topic_document(self) -> pd.DataFrame:
+        """Read topic-document distributions of MALLET LDA model.
+        """
+        data = utils.read_mallet_topic_document(
+            self._topic_document_file, self.num_topics
+        )
+        if len(data) != len(self._documents):
+            raise ValueError(
+                "MALLET returned topic distributions for {} documents, "
+                "but {} documents were exported.".format(
+                    len(data), len(self._documents)
+                )
+            )
+        index = [f"topic{n}" for n in range(self.num_topics)]
+        # MALLET keeps the order of the exported documents, but only the first
+        # word of a document title ends up in its name column:
+        return pd.DataFrame(data.to_numpy().T, index=index, columns=self._documents)
 
     def __repr__(self):
         return (
@@ -7,8 +7,10 @@ This module implements helper functions for topic modeling.
 
 from typing import Generator, List
 from pathlib import Path
+import csv
 
-import cophi
+import numpy as np
+import pandas as pd
 
 
 def read_mallet_topics(path: Path, num_words: int) -> Generator[List[str], None, None]:
@@ -21,7 +23,59 @@ def read_mallet_topics(path: Path, num_words: int) -> Generator[List[str], None,
     Yields:
         A list of tokens, i.e. a topic.
     """
-    with path.open("r", encoding="utf-8") as file:
-        for row in file:
-            sequence = row.split("\t")[2]
-            yield list(cophi.text.utils.find_tokens(sequence))[:200]
+    data = pd.read_csv(
+        path,
+        sep="\t",
+        header=None,
+        usecols=[2],
+        dtype=str,
+        keep_default_na=False,
+        quoting=csv.QUOTE_NONE,
+        engine="c",
+    )
+    # MALLET separates the words of a topic by spaces:
+    for topic in data[2].str.split():
+        yield topic[:num_words]
+
+
+def read_mallet_topic_document(path: Path, num_topics: int) -> pd.DataFrame:
+    """Read a MALLET doc-topics file.
+
+    Older MALLET versions write a `#doc name topic proportion` header and
+    (topic, proportion) pairs, newer ones one proportion per topic.
+
+    Args:
+        path: Filepath to the doc-topics file.
+        num_topics: Number of topics.
+
+    Returns:
+        A document-topic matrix.
+    """
+    with Path(path).open("r", encoding="utf-8") as file:
+        sparse = file.readline().startswith("#")
+        if not sparse:
+            file.seek(0)
+        width = 2 + 2 * num_topics if sparse else 2 + num_topics
+        # Parse the rest of the already opened file:
+        data = pd.read_csv(
+            file,
+            sep="\t",
+            header=None,
+            # Leave room for a trailing tab, and fill shorter rows with NaN:
+            names=range(width + 1),
+            dtype={1: str},
+            # Keep names like `NA` or `null`, only empty proportions are missing:
+            keep_default_na=False,
+            na_values={column: [""] for column in range(2, width + 1)},
+            quoting=csv.QUOTE_NONE,
+            engine="c",
+        )
+    if sparse:
+        pairs = data.iloc[:, 2:width].to_numpy().reshape(-1, 2)
+        rows = np.repeat(np.arange(len(data)), num_topics)
+        present = ~np.isnan(pairs[:, 0])
+        proportions = np.zeros((len(data), num_topics))
+        proportions[rows[present], pairs[present, 0].astype(int)] = pairs[present, 1]
+    else:
+        proportions = data.iloc[:, 2:width].to_numpy()
+    return pd.DataFrame(proportions, index=data[1].to_numpy())
@@ -6,6 +6,9 @@ This module implements the high-level API to communicate with
 the CLI interface of MALLET.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import os
+
 from dariah.mallet import core
 
 
@@ -17,7 +20,10 @@ class MALLET:
         self.executable = executable
 
     def import_dir(self, **parameters):
-        """Load contents of a directory into MALLET instances.
+        """Load contents of one or more directories into MALLET instances.
+
+        Pass a list of directories as `input` to import all of them
+        with a single MALLET call.
         """
         return core.call("import-dir", self.executable, **parameters)
 
@@ -85,3 +91,26 @@ class MALLET:
         """For big input files, efficiently prune vocabulary and import docs.
         """
         return core.call("bulk-load", self.executable, **parameters)
+
+    def map(self, command, jobs, max_workers=None):
+        """Run independent calls of one MALLET command concurrently.
+
+        Parameter:
+            command (str): Command for MALLET, e.g. `train-topics`.
+            jobs (list): Parameters (dicts) for each call.
+            max_workers (int): Maximum number of concurrent calls. Defaults
+                to the number of CPUs.
+
+        Returns:
+            A list with the result of each call, in the order of `jobs`.
+        """
+        jobs = list(jobs)
+        if max_workers is None:
+            max_workers = max(min(len(jobs), os.cpu_count() or 1), 1)
+        # Every call runs in its own JVM, threads only wait for them:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(core.call, command, self.executable, **job)
+                for job in jobs
+            ]
+            return [future.result() for future in futures]
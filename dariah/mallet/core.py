@@ -8,6 +8,16 @@ This module implements the core functions of the MALLET sub-package.
 from dariah.mallet import utils
 
 
+# MALLET options for parameter names that do not translate one-to-one:
+_OPTIONS = {
+    "filepath": "--input",
+    "directory": "--input",
+    "path": "--input",
+    "corpus": "--input",
+    "random_state": "--random-seed",
+}
+
+
 def call(command, executable, **parameters):
     """Call MALLET.
 
@@ -24,14 +34,17 @@ def call(command, executable, **parameters):
 
     # Append additional parameters:
     for parameter, value in parameters.items():
-        # Support synonyms for `-input` parameter:
-        if parameter in {"filepath", "directory", "path", "corpus"}:
-            args.append("--input")
-        elif parameter in {"random_seed", "random_state"}:
-            if value:
-                args.append("--random-seed")
-        else:
-            args.append("--{}".format(parameter.replace("_", "-")))
-        if value and value != True:
+        # Skip unset parameters and disabled flags:
+        if value is None or value is False:
+            continue
+        # Support synonyms, e.g. for `--input` parameter:
+        option = _OPTIONS.get(parameter)
+        args.append(option or "--{}".format(parameter.replace("_", "-")))
+        if isinstance(value, (list, tuple)):
+            # Pass multiple values, e.g. several directories to import,
+            # to a single MALLET process:
+            args.extend(str(item) for item in value)
+        elif value is not True:
+            # A flag is passed without value, but e.g. 0 or 1 are values:
             args.append(str(value))
     return utils.call(args)
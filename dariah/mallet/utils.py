@@ -34,13 +34,14 @@ def call(args: list) -> bool:
 def _process(args: list):
     """Construct a process object.
     """
+    # MALLET logs to stderr, stdout is never read and must not fill up a pipe:
     popen = subprocess.Popen(
-        args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True
+        args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True
     )
-    # Yield every line of stdout:
+    # Yield every line of stderr as soon as it is written:
     for line in iter(popen.stderr.readline, ""):
         yield line.strip()
-    popen.stdout.close()
+    popen.stderr.close()
     code = popen.wait()
     if code:
         raise subprocess.CalledProcessError(code, args)
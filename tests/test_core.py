@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import pytest
 import pandas as pd
 
@@ -146,6 +148,72 @@ def random_state():
     return 23
 
 
+@pytest.fixture
+def mallet_executable(tmpdir, monkeypatch):
+    executable = tmpdir.mkdir("bin").join("mallet")
+    executable.write("#!/bin/sh\n")
+    executable.chmod(0o755)
+    monkeypatch.setenv("PATH", str(executable.dirpath()))
+    monkeypatch.chdir(tmpdir.mkdir("cwd"))
+    return executable
+
+
+@pytest.fixture
+def mallet_model(tmpdir, mallet_executable):
+    output = tmpdir.mkdir("output")
+    topics = output.join("topics.txt")
+    topics.write("0\t0.1\taaa bbb ccc \n1\t0.1\tccc bbb \n")
+    topic_word = output.join("topic-word.txt")
+    topic_word.write(
+        "0\tccc\t6.01\n0\taaa\t9.01\n0\tbbb\t7.01\n"
+        "1\tccc\t12.01\n1\taaa\t0.01\n1\tbbb\t8.01\n"
+    )
+    topic_document = output.join("topic-document.txt")
+    topic_document.write(
+        "0\ta\t0.2058823529411765\t0.7941176470588236\n"
+        "1\tb\t0.7127659574468086\t0.28723404255319146\n"
+        "2\tc\t0.4783549783549784\t0.5216450216450217\n"
+    )
+    lda = dariah.core.modeling.LDA(num_topics=2, mallet="mallet")
+    lda._vocabulary = ["aaa", "bbb", "ccc"]
+    lda._documents = ["a", "b", "c"]
+    lda._topics_file = Path(str(topics))
+    lda._topic_word_file = Path(str(topic_word))
+    lda._topic_document_file = Path(str(topic_document))
+    return lda
+
+
+def test_mallet_executable_file(mallet_executable, monkeypatch):
+    local = mallet_executable.dirpath().dirpath().join("cwd", "mallet")
+    local.write("#!/bin/sh\n")
+    local.chmod(0o755)
+    # A bare name runs the copy in PATH, not the one in the working directory:
+    lda = dariah.core.modeling.LDA(num_topics=2, mallet="mallet")
+    assert lda.mallet == str(Path(str(mallet_executable)).resolve())
+    # Without a copy in PATH, the local file is kept as absolute path:
+    monkeypatch.setenv("PATH", "")
+    lda = dariah.core.modeling.LDA(num_topics=2, mallet="mallet")
+    assert lda.mallet == str(Path(str(local)).resolve())
+
+
+def test_mallet_executable_path(mallet_executable):
+    lda = dariah.core.modeling.LDA(num_topics=2, mallet="mallet")
+    assert lda.mallet == str(Path(str(mallet_executable)).resolve())
+
+
+def test_mallet_executable_windows(mallet_executable, monkeypatch):
+    batch = mallet_executable.dirpath().join("mallet.bat")
+    batch.write("")
+    monkeypatch.setattr(dariah.core.modeling.platform, "system", lambda: "Windows")
+    lda = dariah.core.modeling.LDA(num_topics=2, mallet=str(mallet_executable))
+    assert lda.mallet == str(Path(str(batch)).resolve())
+
+
+def test_mallet_executable_missing(mallet_executable):
+    with pytest.raises(OSError):
+        dariah.core.modeling.LDA(num_topics=2, mallet="does-not-exist")
+
+
 def test_read_mallet_topics(tmpdir):
     p = tmpdir.mkdir("sub").join("topics.txt")
     p.write("0\t0.05\tfoo bar\n1\t0.05\tfoo bar")
@@ -153,6 +221,19 @@ def test_read_mallet_topics(tmpdir):
     assert list(topics) == [["foo", "bar"], ["foo", "bar"]]
 
 
+def test_read_mallet_topic_document(tmpdir):
+    dense = tmpdir.mkdir("dense").join("topic-document.txt")
+    dense.write("0\ta\t0.25\t0.75\n1\tNA\t0.5\t0.0\n")
+    sparse = tmpdir.mkdir("sparse").join("topic-document.txt")
+    sparse.write(
+        "#doc name topic proportion ...\n0\ta\t1\t0.75\t0\t0.25\t\n1\tNA\t0\t0.5\n"
+    )
+    for p in [dense, sparse]:
+        data = dariah.core.utils.read_mallet_topic_document(p, num_topics=2)
+        assert list(data.index) == ["a", "NA"]
+        assert data.values.tolist() == [[0.25, 0.75], [0.5, 0.0]]
+
+
 def test_riddell_lda(
     dtm,
     riddell_topics,
@@ -198,3 +279,53 @@ def test_mallet_lda(
         lda.document_similarities.sum().sum()
         == mallet_document_similarities.sum().sum()
     )
+
+
+def test_mallet_outputs_cached(mallet_model, monkeypatch):
+    mallet_model._read_mallet_outputs()
+
+    def read_again(*args, **kwargs):
+        raise AssertionError("MALLET output file was read again")
+
+    monkeypatch.setattr(dariah.core.utils, "read_mallet_topic_document", read_again)
+    first = mallet_model.topic_document
+    first.loc["topic0", "a"] = 1.0
+    second = mallet_model.topic_document
+    assert second.loc["topic0", "a"] == 0.2058823529411765
+
+
+def test_read_mallet_outputs(
+    mallet_model, mallet_topics, mallet_topic_word, mallet_topic_document
+):
+    mallet_model._read_mallet_outputs()
+    pd.testing.assert_frame_equal(mallet_model.topics, mallet_topics)
+    pd.testing.assert_frame_equal(mallet_model.topic_word, mallet_topic_word)
+    pd.testing.assert_frame_equal(mallet_model.topic_document, mallet_topic_document)
+
+
+def test_read_mallet_topic_document_titles(mallet_model):
+    mallet_model._topic_document_file.write_text(
+        "0\tBleak\t0.25\t0.75\n1\tGreat\t0.5\t0.5\n"
+    )
+    mallet_model._documents = ["Bleak House", "Great Expectations"]
+    data = mallet_model._read_mallet_topic_document()
+    assert list(data.columns) == ["Bleak House", "Great Expectations"]
+    assert data["Great Expectations"].tolist() == [0.5, 0.5]
+    mallet_model._documents = ["Bleak House"]
+    with pytest.raises(ValueError):
+        mallet_model._read_mallet_topic_document()
+
+
+def test_read_mallet_topic_word(mallet_model):
+    mallet_model._topic_word_file.write_text(
+        "0\tfoo\t1.01\n0\tnull\t2.01\n0\tbar\t3.01\n"
+        "1\tfoo\t4.01\n1\tnull\t5.01\n1\tbar\t6.01\n"
+    )
+    data = pd.read_csv(
+        mallet_model._topic_word_file, sep="\t", header=None, keep_default_na=False
+    )
+    expected = data.pivot(index=0, columns=1, values=2)
+    assert "null" in expected.columns
+    topic_word = mallet_model._read_mallet_topic_word()
+    assert list(topic_word.columns) == list(expected.columns)
+    assert topic_word.values.tolist() == expected.values.tolist()
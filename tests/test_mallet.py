@@ -6,7 +6,7 @@ import pytest
 
 sys.path.insert(0, str(Path(".").absolute()))
 
-from dariah.mallet import utils
+from dariah.mallet import api, core, utils
 
 
 def test_call():
@@ -20,6 +20,47 @@ def test_call_error():
         utils.call(["foo"])
 
 
+def test_call_list(monkeypatch):
+    monkeypatch.setattr(utils, "call", lambda args: args)
+    args = core.call("import-dir", "mallet", input=["a", "b"], output="c.mallet")
+    assert args == ["mallet", "import-dir", "--input", "a", "b", "--output", "c.mallet"]
+
+
+def test_call_flags(monkeypatch):
+    monkeypatch.setattr(utils, "call", lambda args: args)
+    args = core.call(
+        "train-topics",
+        "mallet",
+        preserve_case=True,
+        keep_sequence=False,
+        num_topics=1,
+        random_seed=0,
+        alpha=None,
+    )
+    assert args == [
+        "mallet",
+        "train-topics",
+        "--preserve-case",
+        "--num-topics",
+        "1",
+        "--random-seed",
+        "0",
+    ]
+
+
+def test_mallet_map(monkeypatch):
+    monkeypatch.setattr(utils, "call", lambda args: args)
+    mallet = api.MALLET("mallet")
+    results = mallet.map("import-file", [{"input": "a"}, {"input": "b"}])
+    assert results == [
+        ["mallet", "import-file", "--input", "a"],
+        ["mallet", "import-file", "--input", "b"],
+    ]
+    assert mallet.map("import-file", []) == []
+    with pytest.raises(ValueError):
+        mallet.map("import-file", [{"input": "a"}], max_workers=0)
+
+
 EXECUTABLE = "mallet"
 INPUTFILE = Path("test", "document.txt")
 OUTPUTFILE = Path("test", "document.mallet")